@@ -15,6 +15,7 @@ from docx_translator.translator import (
     DEFAULT_MODEL,
     DEFAULT_CACHE_DIR,
     DEFAULT_MAX_CONCURRENT,
+    DEFAULT_BATCH_SIZE,
     DEFAULT_TARGET_LANGUAGE,
 )
 
@@ -93,6 +94,16 @@ def translate(
         "--max-concurrent",
         help="Maximum number of concurrent translation requests",
     ),
+    batch_size: int = typer.Option(
+        int(os.environ.get("OPENAI_BATCH_SIZE", DEFAULT_BATCH_SIZE)),
+        "--batch-size",
+        help="Number of paragraphs to group into one API request",
+    ),
+    max_per_second: Optional[float] = typer.Option(
+        None,
+        "--max-per-second",
+        help="Maximum translation requests to dispatch per second",
+    ),
 ) -> None:
     """Translate a Word document using OpenAI API.
 
@@ -141,11 +152,12 @@ def translate(
     if clear_cache:
         logger.info("Clearing translation cache")
         cache_dir.mkdir(parents=True, exist_ok=True)
-        cache_file = (
-            cache_dir
-            / f"cache_{target_language.lower().replace(' ', '_')}_{model.replace('-', '_')}.json"
+        cache_stem = (
+            f"cache_{target_language.lower().replace(' ', '_')}_{model.replace('-', '_')}"
         )
-        if cache_file.exists():
+        # Remove the SQLite database with its WAL/SHM sidecars, plus any
+        # legacy JSON cache
+        for cache_file in cache_dir.glob(f"{cache_stem}.*"):
             try:
                 cache_file.unlink()
                 logger.info(f"Removed cache file: {cache_file}")
@@ -168,6 +180,8 @@ def translate(
             cache_dir=cache_dir,
             parallel=not sequential,
             max_concurrent=max_concurrent,
+            batch_size=batch_size,
+            max_per_second=max_per_second,
         )
 
         elapsed_time = time.time() - start_time
@@ -93,6 +93,27 @@ if "current_eta" not in st.session_state:
 if "download_available" not in st.session_state:
     st.session_state.download_available = False
 
+
+def _format_eta(eta_seconds: float) -> str:
+    """Format remaining seconds as the shared " (ETA: MM:SS)" suffix"""
+    eta_minutes = int(eta_seconds // 60)
+    eta_secs = int(eta_seconds % 60)
+    return f" (ETA: {eta_minutes:02d}:{eta_secs:02d})"
+
+
+def _with_eta(description: str) -> str:
+    """Append the stored ETA suffix to a description, replacing any stale one
+
+    Centralizes the split-and-append dance that several call sites used to
+    repeat inline, so the session-state lookup and string work happen once
+    per call instead of being duplicated.
+    """
+    eta_part = st.session_state.get("current_eta")
+    if not eta_part:
+        return description
+    return description.split(" (ETA:")[0] + eta_part
+
+
 # Sidebar for API key and settings
 with st.sidebar:
     st.title("DocxTranslator Settings")
@@ -248,12 +269,14 @@ def translation_thread_func(params, queue):
         # Clear the cache if requested
         if params["clear_cache"] and params["use_cache"]:
             try:
-                cache_file = (
-                    Path(params["cache_dir"])
-                    / f"cache_{params['target_language'].lower().replace(' ', '_')}_{params['model'].replace('-', '_')}.json"
-                )
-                if cache_file.exists():
+                cache_stem = f"cache_{params['target_language'].lower().replace(' ', '_')}_{params['model'].replace('-', '_')}"
+                # Remove the SQLite database with its WAL/SHM sidecars, plus
+                # any legacy JSON cache
+                removed = False
+                for cache_file in Path(params["cache_dir"]).glob(f"{cache_stem}.*"):
                     os.remove(cache_file)
+                    removed = True
+                if removed:
                     queue.put(
                         (
                             "info",
@@ -326,23 +349,14 @@ def translation_thread_func(params, queue):
             # Get token counts from global variables in translator module
             from docx_translator import translator
 
-            api_tokens = translator.total_tokens_received
-            cached_tokens = translator.total_cached_tokens
-
-            # Show more detailed progress with current/total, percentage
-            # Check if we have a previously calculated ETA stored in session state
-            eta_part = ""
-            # Use get() method to safely access the variable with a default value
-            if st.session_state.get("current_eta") is not None:
-                eta_part = st.session_state.get("current_eta")
-
-            # Always create description with the most recent ETA
-            # Basic progress description
-            simple_description = f"Progress: {current}/{total}, {int(progress * 100)}%"
+            api_tokens = translator.token_counters.api
+            cached_tokens = translator.token_counters.cached
 
-            # Always add the ETA if available
-            if eta_part:
-                simple_description += eta_part
+            # Show more detailed progress with current/total, percentage,
+            # carrying over the most recently calculated ETA
+            simple_description = _with_eta(
+                f"Progress: {current}/{total}, {int(progress * 100)}%"
+            )
 
             # Always push updates to the queue, even for small changes
             queue.put(("progress", (progress, simple_description)))
@@ -426,10 +440,15 @@ if uploaded_file:
     doc = Document(tmp_input_path)
 
     # Extract styles from document
+    # Read each paragraph's style name once and track membership with a set;
+    # the triple attribute read plus list scan added up on long documents
     available_styles = []
+    seen_styles = set()
     for para in doc.paragraphs:
-        if para.style.name and para.style.name not in available_styles:
-            available_styles.append(para.style.name)
+        style_name = para.style.name
+        if style_name and style_name not in seen_styles:
+            seen_styles.add(style_name)
+            available_styles.append(style_name)
 
     # If tables exist, also check table styles
     for table in doc.tables:
@@ -599,13 +618,7 @@ if uploaded_file:
         progress_bar.progress(st.session_state.progress_value)
 
         # Always show the progress description - this ensures it stays visible
-        current_description = st.session_state.progress_description
-
-        # Make sure current description always includes the ETA if available
-        if " (ETA:" not in current_description and st.session_state.get("current_eta"):
-            current_description = current_description.split(" (ETA:")[
-                0
-            ] + st.session_state.get("current_eta")
+        current_description = _with_eta(st.session_state.progress_description)
 
         # Always update the status text with current progress
         status_text.text(current_description)
@@ -694,26 +707,25 @@ if uploaded_file:
                                     # Calculate remaining time based on rate
                                     remaining_progress = 1.0 - progress_value
                                     eta_seconds = remaining_progress / progress_rate
+                                    # Lazy formatting: the message is only
+                                    # built if DEBUG is actually emitted
                                     logger.debug(
-                                        f"Progress calculation: rate={progress_rate}, remaining={remaining_progress}, eta={eta_seconds}"
+                                        "Progress calculation: rate={}, remaining={}, eta={}",
+                                        progress_rate,
+                                        remaining_progress,
+                                        eta_seconds,
                                     )
 
                                     # Format minutes and seconds
                                     if eta_seconds > 0:
-                                        eta_minutes = int(eta_seconds // 60)
-                                        eta_secs = int(eta_seconds % 60)
-                                        eta_str = (
-                                            f" (ETA: {eta_minutes:02d}:{eta_secs:02d})"
-                                        )
+                                        eta_str = _format_eta(eta_seconds)
 
                                         # Store the ETA in session state for reuse
                                         st.session_state["current_eta"] = eta_str
 
-                                        # Make sure to split by ETA to remove any previous ETA information
-                                        description = (
-                                            description.split(" (ETA:")[0] + eta_str
-                                        )
-                                        logger.debug(f"New ETA calculated: {eta_str}")
+                                        # Replace any previous ETA information
+                                        description = _with_eta(description)
+                                        logger.debug("New ETA calculated: {}", eta_str)
 
                             # Update last progress for next calculation
                             st.session_state.last_progress_value = progress_value
@@ -723,18 +735,13 @@ if uploaded_file:
                             st.session_state.progress_value = progress_value
 
                             # Make sure we always include the ETA
-                            if " (ETA:" not in description and st.session_state.get(
-                                "current_eta"
-                            ):
-                                description = description.split(" (ETA:")[
-                                    0
-                                ] + st.session_state.get("current_eta")
+                            description = _with_eta(description)
 
                             # Store in session state for the main UI loop to pick up
                             st.session_state.progress_description = description
 
                             # Debug output for tracking
-                            logger.debug(f"Progress update in handler: {description}")
+                            logger.debug("Progress update in handler: {}", description)
 
                             # No need to update UI here - the main UI loop will handle this consistently
 
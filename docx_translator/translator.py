@@ -2,16 +2,23 @@ import os
 import time
 import json
 import hashlib
+import sqlite3
 import sys
 import asyncio
+import atexit
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Set, Dict, Any, Tuple
+from typing import List, Optional, FrozenSet, Dict, Any, Tuple
 
+import httpx
+import tiktoken
 from docx import Document
 from docx.enum.text import WD_BREAK
 from docx.shared import RGBColor
 from openai import OpenAI
 from openai import AsyncOpenAI
+from openai import RateLimitError
 from loguru import logger
 from tqdm import tqdm
 
@@ -22,6 +29,10 @@ INITIAL_RETRY_DELAY = 1
 TEMPERATURE = 0.3
 DEFAULT_CACHE_DIR = Path.home() / ".cache/.docx_translator"
 DEFAULT_MAX_CONCURRENT = 5
+DEFAULT_BATCH_SIZE = 10
+DEFAULT_MAX_BATCH_CHARS = 4000
+DEFAULT_RPM = int(os.environ.get("OPENAI_RPM", 3000))
+DEFAULT_TPM = int(os.environ.get("OPENAI_TPM", 250000))
 DEFAULT_TARGET_LANGUAGE = os.environ.get("TARGET_LANGUAGE", "Spanish")
 
 # Configure logging with loguru
@@ -42,8 +53,111 @@ logger.add(
 
 # Create a dictionary to track streaming progress
 translation_progress = {}
-total_tokens_received = 0
-total_cached_tokens = 0  # Track total tokens from cache
+
+
+class _Counters:
+    """Token counters for the current translation run
+
+    Attribute access through __slots__ replaces the previous module-level
+    integer globals: mutators no longer need global statements, and every
+    update is an instance-attribute write instead of a module-dict write.
+    """
+
+    __slots__ = ("api", "cached")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero both counters at the start of a run"""
+        self.api = 0
+        self.cached = 0
+
+
+# Shared instance read by the UI while a run is in progress
+token_counters = _Counters()
+
+# In-flight translations keyed by (target_language, text) so concurrent
+# requests for identical texts coalesce into a single API call
+_inflight_translations: Dict[Tuple[str, str], asyncio.Future] = {}
+
+
+# Clients built by the registries below stay alive for the life of the
+# process so later documents reuse their connections; close them on exit
+_cached_clients: List[Any] = []
+
+
+def _close_cached_clients() -> None:
+    """Close the pooled HTTP connections of the cached OpenAI clients"""
+    for client in _cached_clients:
+        try:
+            if isinstance(client, AsyncOpenAI):
+                asyncio.run(client.close())
+            else:
+                client.close()
+        except Exception:
+            pass
+
+
+atexit.register(_close_cached_clients)
+
+
+@lru_cache(maxsize=4)
+def _sync_client(api_key: str, base_url: Optional[str]) -> OpenAI:
+    """Build (or return the cached) sync OpenAI client for a key/endpoint
+
+    Args:
+        api_key: OpenAI API key
+        base_url: OpenAI API base URL for custom endpoints (optional)
+
+    Returns:
+        OpenAI client instance
+    """
+    client_kwargs = {"api_key": api_key}
+
+    # Add base_url if provided
+    if base_url:
+        client_kwargs["base_url"] = base_url
+        logger.info(f"Using custom OpenAI API base URL: {base_url}")
+
+    client = OpenAI(**client_kwargs)
+    _cached_clients.append(client)
+    return client
+
+
+@lru_cache(maxsize=4)
+def _async_client(api_key: str, base_url: Optional[str], pool_size: int) -> AsyncOpenAI:
+    """Build (or return the cached) async OpenAI client for a key/endpoint
+
+    The client owns an httpx connection pool sized for the concurrency
+    level, so reusing it across documents skips DNS lookups and TLS
+    handshakes on every run after the first.
+
+    Args:
+        api_key: OpenAI API key
+        base_url: OpenAI API base URL for custom endpoints (optional)
+        pool_size: Maximum connections to keep in the HTTP pool
+
+    Returns:
+        AsyncOpenAI client instance
+    """
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+        )
+    )
+
+    client_kwargs = {"api_key": api_key, "http_client": http_client}
+
+    # Add base_url if provided
+    if base_url:
+        client_kwargs["base_url"] = base_url
+        logger.info(f"Using custom OpenAI API base URL: {base_url}")
+
+    client = AsyncOpenAI(**client_kwargs)
+    _cached_clients.append(client)
+    return client
 
 
 def setup_openai_client(
@@ -51,6 +165,9 @@ def setup_openai_client(
 ) -> OpenAI:
     """Set up and return OpenAI client
 
+    Clients are cached per (api_key, base_url) so repeated calls in the
+    same process reuse connections.
+
     Args:
         api_key: OpenAI API key (optional if environment variable is set)
         base_url: OpenAI API base URL for custom endpoints (optional)
@@ -67,24 +184,24 @@ def setup_openai_client(
             "OpenAI API key is required. Set it via --api_key or OPENAI_API_KEY environment variable."
         )
 
-    client_kwargs = {"api_key": key}
-
-    # Add base_url if provided
-    if base_url:
-        client_kwargs["base_url"] = base_url
-        logger.info(f"Using custom OpenAI API base URL: {base_url}")
-
-    return OpenAI(**client_kwargs)
+    return _sync_client(key, str(base_url) if base_url else None)
 
 
 def setup_async_openai_client(
-    api_key: Optional[str] = None, base_url: Optional[str] = None
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None,
+    pool_size: int = DEFAULT_MAX_CONCURRENT * 2,
 ) -> AsyncOpenAI:
     """Set up and return async OpenAI client
 
+    Clients are cached per (api_key, base_url, pool_size) so repeated
+    calls in the same process reuse the pooled connections.
+
     Args:
         api_key: OpenAI API key (optional if environment variable is set)
         base_url: OpenAI API base URL for custom endpoints (optional)
+        pool_size: Maximum connections to keep in the underlying HTTP
+            pool, typically sized for the concurrency level
 
     Returns:
         AsyncOpenAI client instance
@@ -98,18 +215,209 @@ def setup_async_openai_client(
             "OpenAI API key is required. Set it via --api_key or OPENAI_API_KEY environment variable."
         )
 
-    client_kwargs = {"api_key": key}
+    return _async_client(key, str(base_url) if base_url else None, pool_size)
 
-    # Add base_url if provided
-    if base_url:
-        client_kwargs["base_url"] = base_url
-        logger.info(f"Using custom OpenAI API base URL: {base_url}")
 
-    return AsyncOpenAI(**client_kwargs)
+@lru_cache(maxsize=32)
+def _system_message(target_language: str) -> Dict[str, str]:
+    """Build the system message for a target language, cached per language
+
+    The instructions are identical for every paragraph, so formatting them
+    once per language avoids rebuilding the same string and dict on every
+    request. Callers must not mutate the returned dict.
+
+    Args:
+        target_language: The target language
+
+    Returns:
+        Chat message dict carrying the translation instructions
+    """
+    return {
+        "role": "system",
+        "content": (
+            f"You are a professional translator. Translate the user's text into {target_language}. "
+            "Keep formatting such as bold, italic, or links intact. "
+            "Translate only the text itself without adding any explanations."
+        ),
+    }
+
+
+# Tokenizer for local token accounting, initialized lazily on first use
+_token_encoding = None
+
+
+def _count_tokens(text: str) -> int:
+    """Count the tokens in a text locally with tiktoken
+
+    Used for providers that never report usage, where a local BPE encode
+    replaces what would otherwise be guesswork. Falls back to a rough
+    word-based estimate if the tokenizer cannot be initialized (e.g. no
+    cached BPE data and no network access).
+
+    Args:
+        text: The text to count tokens for
+
+    Returns:
+        Number of tokens in the text
+    """
+    global _token_encoding
+    if _token_encoding is None:
+        try:
+            try:
+                _token_encoding = tiktoken.encoding_for_model(DEFAULT_MODEL)
+            except KeyError:
+                _token_encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            logger.warning(f"tiktoken unavailable, falling back to estimates: {e}")
+            _token_encoding = False
+
+    if _token_encoding:
+        return len(_token_encoding.encode(text))
+    return int(len(text.split()) * 1.3)
+
+
+def _estimate_request_tokens(text: str) -> int:
+    """Roughly estimate the token cost of a translation request
+
+    Args:
+        text: The text to be sent for translation
+
+    Returns:
+        Estimated number of tokens for the request (prompt plus overhead)
+    """
+    return len(text) // 4 + 50
+
+
+class RateThrottler:
+    """Proactive request and token budget shared by concurrent translation tasks
+
+    Tracks remaining requests-per-minute and tokens-per-minute capacity and
+    makes callers wait before dispatching a request that would exceed the
+    account's quota, instead of reacting to rate limit errors after they
+    happen. Capacity refills continuously at rpm/60 and tpm/60 per second.
+    """
+
+    def __init__(self, rpm: int = DEFAULT_RPM, tpm: int = DEFAULT_TPM):
+        """Initialize the throttler
+
+        Args:
+            rpm: Requests-per-minute budget
+            tpm: Tokens-per-minute budget
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self.available_request_capacity = float(rpm)
+        self.available_token_capacity = float(tpm)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Refill both buckets based on the time elapsed since the last refill"""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self.available_request_capacity = min(
+            float(self.rpm), self.available_request_capacity + elapsed * self.rpm / 60
+        )
+        self.available_token_capacity = min(
+            float(self.tpm), self.available_token_capacity + elapsed * self.tpm / 60
+        )
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        """Wait until the budget covers one request of the given size, then consume it
+
+        Args:
+            estimated_tokens: Estimated token cost of the request about to be sent
+        """
+        while True:
+            async with self._lock:
+                self._refill()
+                if (
+                    self.available_request_capacity >= 1
+                    and self.available_token_capacity >= estimated_tokens
+                ):
+                    self.available_request_capacity -= 1
+                    self.available_token_capacity -= estimated_tokens
+                    return
+
+                # Wait just long enough for the deficit to refill
+                request_wait = (
+                    (1 - self.available_request_capacity) * 60 / self.rpm
+                    if self.available_request_capacity < 1
+                    else 0.0
+                )
+                token_wait = (
+                    (estimated_tokens - self.available_token_capacity) * 60 / self.tpm
+                    if self.available_token_capacity < estimated_tokens
+                    else 0.0
+                )
+                delay = max(request_wait, token_wait, 0.05)
+
+            await asyncio.sleep(delay)
+
+    def penalize(self) -> None:
+        """Drain both buckets after a rate limit error so all tasks back off together"""
+        self.available_request_capacity = 0.0
+        self.available_token_capacity = 0.0
+        self._last_refill = time.monotonic()
+
+
+class AdmissionController:
+    """Admission counter that caps how many translation tasks run at once
+
+    Serves the same role as asyncio.Semaphore but keeps the count in an
+    explicit attribute guarded by an asyncio.Condition, so the limit can be
+    resized safely while tasks are in flight (e.g. from a UI control):
+    raising it wakes blocked waiters immediately, lowering it stops
+    admitting new tasks without disturbing the ones already running.
+    """
+
+    def __init__(self, limit: int):
+        """Initialize the controller
+
+        Args:
+            limit: Maximum number of tasks admitted at once
+        """
+        self.limit = limit
+        self.active = 0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free and claim it"""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+
+    async def release(self) -> None:
+        """Release a claimed slot and wake one waiter"""
+        async with self._cond:
+            self.active -= 1
+            self._cond.notify(1)
+
+    async def set_limit(self, limit: int) -> None:
+        """Change the admission limit while tasks are running
+
+        Args:
+            limit: New maximum number of concurrently admitted tasks
+        """
+        async with self._cond:
+            self.limit = limit
+            self._cond.notify_all()
 
 
 class TranslationCache:
-    """Cache for translations to avoid redundant API calls"""
+    """Cache for translations to avoid redundant API calls
+
+    Backed by a SQLite database in WAL mode so each insert is a cheap indexed
+    write instead of rewriting the whole cache as a JSON blob. WAL also makes
+    the cache safe to share between several docx-translator processes working
+    on different documents: writers block each other only briefly (bounded by
+    the busy timeout) and readers are never blocked. A pre-existing JSON cache
+    for the same language and model is imported on first use.
+    """
+
+    COMMIT_INTERVAL = 50  # Commit pending writes every N inserts
+    SELECT_CHUNK_SIZE = 900  # Stay under SQLite's bound-parameter limit
 
     def __init__(
         self,
@@ -128,22 +436,57 @@ class TranslationCache:
         self.cache_dir.mkdir(exist_ok=True, parents=True)
 
         # Create a cache file specific to this language and model
-        cache_filename = f"cache_{target_language.lower().replace(' ', '_')}_{model.replace('-', '_')}.json"
+        cache_filename = f"cache_{target_language.lower().replace(' ', '_')}_{model.replace('-', '_')}.db"
         self.cache_file = self.cache_dir / cache_filename
 
-        # Load existing cache if available
-        self.cache: Dict[str, Dict[str, Any]] = {}
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, "r", encoding="utf-8") as f:
-                    self.cache = json.load(f)
-                logger.info(
-                    f"Loaded {len(self.cache)} cached translations for {target_language}"
-                )
-            except Exception as e:
-                logger.warning(f"Failed to load translation cache: {e}")
-                # Start with an empty cache if loading fails
-                self.cache = {}
+        self._conn = sqlite3.connect(self.cache_file, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # Wait for competing writers from other processes instead of raising
+        # "database is locked" immediately
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._lock = threading.Lock()
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations "
+            "(key TEXT PRIMARY KEY, translation TEXT, token_usage TEXT)"
+        )
+        self._conn.commit()
+        self._pending_writes = 0
+        self._flush_scheduled = False
+
+        # Import entries from a cache written before the move to SQLite
+        self._import_legacy_cache()
+
+        count = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        if count:
+            logger.info(f"Loaded {count} cached translations for {target_language}")
+
+    def _import_legacy_cache(self) -> None:
+        """Import entries from a pre-SQLite JSON cache file, if one exists"""
+        legacy_file = self.cache_file.with_suffix(".json")
+        if not legacy_file.exists():
+            return
+
+        try:
+            with open(legacy_file, "r", encoding="utf-8") as f:
+                legacy_cache = json.load(f)
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO translations VALUES (?, ?, ?)",
+                (
+                    (
+                        key,
+                        entry.get("translation", ""),
+                        json.dumps(entry.get("token_usage", {}), ensure_ascii=False),
+                    )
+                    for key, entry in legacy_cache.items()
+                ),
+            )
+            self._conn.commit()
+            # Keep the old file around but stop re-importing it
+            legacy_file.rename(legacy_file.with_name(legacy_file.name + ".bak"))
+            logger.info(f"Imported {len(legacy_cache)} entries from legacy JSON cache")
+        except Exception as e:
+            logger.warning(f"Failed to import legacy translation cache: {e}")
 
     def get_cache_key(self, text: str) -> str:
         """Generate a unique key for the text
@@ -154,7 +497,19 @@ class TranslationCache:
         Returns:
             A unique hash for the text
         """
-        # Use MD5 hash of the text as the key
+        # blake2b is considerably faster than MD5 on typical paragraph sizes;
+        # a 16-byte digest is plenty for a cache key
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _legacy_cache_key(self, text: str) -> str:
+        """Generate the MD5 key used before the switch to blake2b
+
+        Args:
+            text: The text to be cached
+
+        Returns:
+            The legacy MD5 hash for the text
+        """
         return hashlib.md5(text.encode("utf-8")).hexdigest()
 
     def get(self, text: str) -> Optional[Dict[str, Any]]:
@@ -167,7 +522,101 @@ class TranslationCache:
             Dictionary with translated text and token usage or None if not found
         """
         key = self.get_cache_key(text)
-        return self.cache.get(key)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT translation, token_usage FROM translations WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                # Fall back to the MD5 key used by older caches and re-key the
+                # entry so the fallback is only paid once per text
+                row = self._conn.execute(
+                    "SELECT translation, token_usage FROM translations WHERE key = ?",
+                    (self._legacy_cache_key(text),),
+                ).fetchone()
+                if row is None:
+                    return None
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO translations VALUES (?, ?, ?)",
+                    (key, row[0], row[1]),
+                )
+
+        translation, usage_json = row
+        return {
+            "translation": translation,
+            "token_usage": json.loads(usage_json) if usage_json else {},
+        }
+
+    def _select_many(self, keys: List[str]) -> List[Tuple[str, str, str]]:
+        """Fetch rows for the given keys with chunked bulk SELECTs
+
+        Args:
+            keys: Cache keys to look up
+
+        Returns:
+            List of (key, translation, token_usage) rows that were found
+        """
+        rows: List[Tuple[str, str, str]] = []
+        with self._lock:
+            for start in range(0, len(keys), self.SELECT_CHUNK_SIZE):
+                chunk = keys[start : start + self.SELECT_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(
+                    self._conn.execute(
+                        f"SELECT key, translation, token_usage FROM translations "
+                        f"WHERE key IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                )
+        return rows
+
+    def get_many(self, texts: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get translations for several texts with bulk queries
+
+        One query per SELECT_CHUNK_SIZE texts instead of one per text, which
+        matters when a large document is mostly cache hits.
+
+        Args:
+            texts: The texts to look up
+
+        Returns:
+            Dictionary mapping each found text to its cache entry; texts
+            without a cached translation are absent from the result
+        """
+        result: Dict[str, Dict[str, Any]] = {}
+        if not texts:
+            return result
+
+        key_to_text = {self.get_cache_key(text): text for text in texts}
+        for key, translation, usage_json in self._select_many(list(key_to_text)):
+            result[key_to_text[key]] = {
+                "translation": translation,
+                "token_usage": json.loads(usage_json) if usage_json else {},
+            }
+
+        # Fall back to the MD5 keys used by older caches for any misses and
+        # re-key the hits so the fallback is only paid once per text
+        missing = [text for text in texts if text not in result]
+        if missing:
+            legacy_key_to_text = {self._legacy_cache_key(t): t for t in missing}
+            rekeyed = []
+            for key, translation, usage_json in self._select_many(
+                list(legacy_key_to_text)
+            ):
+                text = legacy_key_to_text[key]
+                result[text] = {
+                    "translation": translation,
+                    "token_usage": json.loads(usage_json) if usage_json else {},
+                }
+                rekeyed.append((self.get_cache_key(text), translation, usage_json))
+            if rekeyed:
+                with self._lock:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO translations VALUES (?, ?, ?)", rekeyed
+                    )
+
+        return result
 
     def set(
         self, text: str, translation: str, token_usage: Optional[Dict[str, int]] = None
@@ -182,21 +631,34 @@ class TranslationCache:
         key = self.get_cache_key(text)
 
         # Store both the translation and token usage
-        self.cache[key] = {
-            "translation": translation,
-            "token_usage": token_usage or {},
-        }
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO translations VALUES (?, ?, ?)",
+                (key, translation, json.dumps(token_usage or {}, ensure_ascii=False)),
+            )
+            self._pending_writes += 1
+
+        # Periodically commit pending writes to disk from a short-lived
+        # background thread so translation completions never block on the
+        # commit; the final save() drains anything still pending
+        if self._pending_writes >= self.COMMIT_INTERVAL and not self._flush_scheduled:
+            self._flush_scheduled = True
+            threading.Thread(target=self._background_save, daemon=True).start()
 
-        # Periodically save the cache to disk (every 10 new entries)
-        if len(self.cache) % 10 == 0:
+    def _background_save(self) -> None:
+        """Commit pending writes off the caller's thread"""
+        try:
             self.save()
+        finally:
+            self._flush_scheduled = False
 
     def save(self) -> None:
-        """Save the cache to disk"""
+        """Commit any pending cache writes to disk"""
         try:
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(self.cache, f, ensure_ascii=False, indent=2)
-            logger.debug(f"Saved translation cache with {len(self.cache)} entries")
+            with self._lock:
+                self._conn.commit()
+                self._pending_writes = 0
+            logger.debug("Committed pending translation cache writes")
         except Exception as e:
             logger.error(f"Failed to save translation cache: {e}")
 
@@ -208,9 +670,19 @@ async def stream_async_translation(
     cache: Optional[TranslationCache] = None,
     progress_bar: Optional[tqdm] = None,
     task_id: Optional[str] = None,
-    cancellation_check=None,
-) -> Tuple[str, str]:
-    """Translate text asynchronously with streaming using the OpenAI API
+    throttler: Optional[RateThrottler] = None,
+    stream: bool = False,
+    cache_checked: bool = False,
+) -> Tuple[str, str, int]:
+    """Translate text asynchronously using the OpenAI API
+
+    By default a single non-streaming request is issued; nothing consumes the
+    per-chunk updates in parallel mode, so streaming only adds per-chunk
+    Python overhead. Pass stream=True to restore incremental progress updates
+    in translation_progress.
+
+    Cancellation is not polled here: callers cancel the surrounding task and
+    the next await point raises asyncio.CancelledError natively.
 
     Args:
         text: The text to translate
@@ -219,37 +691,37 @@ async def stream_async_translation(
         cache: Optional TranslationCache instance
         progress_bar: Optional tqdm progress bar to update
         task_id: Optional task ID for tracking progress
-        cancellation_check: Optional function to check if translation should be cancelled
+        throttler: Optional RateThrottler to reserve rate limit budget before dispatch
+        stream: Whether to stream the response token by token
+        cache_checked: Whether the caller already looked this text up in the
+            cache (e.g. in a bulk pre-scan) and found nothing, making a
+            second per-text query pointless
 
     Returns:
-        Tuple containing the translated text and translation status
+        Tuple containing the translated text, the translation status, and the
+        number of tokens used (from the API, or from cache for cached hits);
+        the caller is responsible for accumulating token totals
     """
-    global total_tokens_received, total_cached_tokens, translation_progress
-
-    # Check if translation should be cancelled
-    if cancellation_check and cancellation_check():
-        return "", "cancelled"
+    global translation_progress
 
     # Initialize task progress if task_id is provided
     if task_id:
         translation_progress[task_id] = {"status": "starting", "text": "", "tokens": 0}
 
-    # Try to get from cache first if cache is provided
-    if cache:
+    # Try to get from cache first, unless the caller already checked
+    if cache and not cache_checked:
         cached_translation = cache.get(text)
         if cached_translation:
             translated_text = cached_translation["translation"]
-            # Update token counts if available
             token_usage = cached_translation.get("token_usage", {})
-            if token_usage:
-                total_cached_tokens += token_usage.get("total_tokens", 0)
+            cached_tokens = token_usage.get("total_tokens", 0) if token_usage else 0
 
             # Update progress
             if task_id:
                 translation_progress[task_id] = {
                     "status": "completed",
                     "text": translated_text,
-                    "tokens": token_usage.get("total_tokens", 0),
+                    "tokens": cached_tokens,
                     "from_cache": True,
                 }
 
@@ -257,132 +729,304 @@ async def stream_async_translation(
             if progress_bar:
                 progress_bar.update(1)
 
-            return translated_text, "cached"
-
-    # Set status to in_progress
+            return translated_text, "cached", cached_tokens
+
+    # Coalesce with an identical in-flight translation if one exists: the
+    # first request creates a future, duplicates await the same result
+    inflight_key = (target_language, text)
+    existing = _inflight_translations.get(inflight_key)
+    if existing is not None:
+        translated_text, status, _ = await existing
+
+        # Update progress
+        if task_id:
+            translation_progress[task_id] = {
+                "status": status,
+                "text": translated_text,
+                "tokens": 0,
+                "from_cache": True,
+            }
+
+        # Update progress bar if provided
+        if progress_bar:
+            progress_bar.update(1)
+
+        # Tokens were already counted by the request that did the work
+        return translated_text, status, 0
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight_translations[inflight_key] = fut
+
+    def _resolve(result: Tuple[str, str, int]) -> Tuple[str, str, int]:
+        """Publish the outcome to any coalesced duplicate requests"""
+        if _inflight_translations.get(inflight_key) is fut:
+            del _inflight_translations[inflight_key]
+        if not fut.done():
+            fut.set_result(result)
+        return result
+
+    # Set status to in_progress; bind the per-task dict to a local so the
+    # hot streaming loop below skips the repeated registry lookup
+    task_progress = None
     if task_id:
-        translation_progress[task_id] = {
+        task_progress = {
             "status": "in_progress",
             "text": "",
             "tokens": 0,
         }
+        translation_progress[task_id] = task_progress
+
+    # Build the messages with the cached per-language system prompt
+    messages = [_system_message(target_language), {"role": "user", "content": text}]
+
+    try:
+        for attempt in range(MAX_RETRIES):
+            try:
+                # Reserve rate limit budget before dispatching the request
+                if throttler:
+                    await throttler.acquire(_estimate_request_tokens(text))
+
+                translated_text = ""
+                tokens_count = 0
+                stream_usage = None
+
+                if stream:
+                    # Streaming response through chat completions API
+                    response_stream = await client.chat.completions.create(
+                        model=DEFAULT_MODEL,
+                        messages=messages,
+                        temperature=TEMPERATURE,
+                        stream=True,
+                        stream_options={"include_usage": True},
+                    )
 
-    # Prepare the prompt
-    prompt = f"Translate the following text into {target_language}. Keep formatting such as bold, italic, or links intact. Translate only the text itself without adding any explanations.\n\nText to translate:\n\n{text}"
+                    # Collect deltas in a list and join once at the end; repeated
+                    # += on an immutable string degrades to quadratic time.
+                    # Bind the append method once rather than paying an
+                    # attribute lookup per streamed chunk
+                    parts: List[str] = []
+                    parts_append = parts.append
+                    async for chunk in response_stream:
+                        # The chunk schema is fixed: choices[0].delta.content is
+                        # either a string or None, so read it directly instead of
+                        # probing with hasattr/len on every streamed token
+                        delta = chunk.choices[0].delta if chunk.choices else None
+                        content = getattr(delta, "content", None)
+
+                        if content:
+                            parts_append(content)
+                            tokens_count += 1
+                            # Publish the counter at a coarse cadence; a dict
+                            # write per streamed token is pure overhead
+                            if task_progress is not None and tokens_count % 16 == 0:
+                                task_progress["tokens"] = tokens_count
+
+                        # The final chunk carries the real usage when requested
+                        if chunk.usage:
+                            stream_usage = chunk.usage
+
+                    translated_text = "".join(parts)
+                    if task_progress is not None:
+                        task_progress["text"] = translated_text
+                        task_progress["tokens"] = tokens_count
+                else:
+                    # Single non-streaming request; content and usage come directly
+                    # from the response without a per-chunk loop
+                    response = await client.chat.completions.create(
+                        model=DEFAULT_MODEL,
+                        messages=messages,
+                        temperature=TEMPERATURE,
+                    )
+                    translated_text = response.choices[0].message.content or ""
+                    stream_usage = response.usage
+
+                # Prefer the real token usage from the stream, estimating only for
+                # providers that omit usage chunks
+                token_usage = None
+                tokens_used = 0
+                if stream_usage and stream_usage.total_tokens:
+                    tokens_used = stream_usage.total_tokens
+                    token_usage = {"total_tokens": tokens_used}
+                else:
+                    try:
+                        # Count tokens locally instead of guessing from word counts
+                        tokens_used = _count_tokens(text) + _count_tokens(
+                            translated_text
+                        )
+                        token_usage = {"total_tokens": tokens_used}
+                    except Exception as e:
+                        logger.warning(f"Could not count token usage: {e}")
+
+                # Store in cache
+                if cache:
+                    cache.set(text, translated_text, token_usage)
+
+                # Update progress
+                if task_id:
+                    translation_progress[task_id] = {
+                        "status": "completed",
+                        "text": translated_text,
+                        "tokens": (
+                            token_usage.get("total_tokens", 0)
+                            if token_usage
+                            else tokens_count
+                        ),
+                        "from_cache": False,
+                    }
+
+                # Update progress bar if provided
+                if progress_bar:
+                    progress_bar.update(1)
+
+                return _resolve((translated_text, "completed", tokens_used))
+
+            except Exception as e:
+                # Drain the shared budget so other tasks back off too
+                if throttler and isinstance(e, RateLimitError):
+                    throttler.penalize()
+
+                # Exponential backoff with jitter
+                retry_delay = INITIAL_RETRY_DELAY * (2**attempt) + INITIAL_RETRY_DELAY * (
+                    attempt * 0.1
+                )
+                logger.exception(e)
+                logger.warning(
+                    f"Translation attempt {attempt + 1}/{MAX_RETRIES} failed: {e}, retrying in {retry_delay:.2f}s"
+                )
+
+                await asyncio.sleep(retry_delay)
+
+        # If we're here, all retries failed
+        error_message = f"Failed to translate text after {MAX_RETRIES} attempts"
+        logger.error(error_message)
+
+        # Update progress with error status
+        if task_id:
+            translation_progress[task_id] = {
+                "status": "error",
+                "text": error_message,
+                "tokens": 0,
+            }
+
+        return _resolve(("", "error", 0))
+    except asyncio.CancelledError:
+        # The caller cancelled the task; release any coalesced duplicates
+        # before propagating so they do not wait on a future that never
+        # resolves
+        if _inflight_translations.get(inflight_key) is fut:
+            del _inflight_translations[inflight_key]
+        if not fut.done():
+            fut.cancel()
+        raise
+
+
+async def batch_translate(
+    texts: List[str],
+    target_language: str,
+    client: AsyncOpenAI,
+    cache: Optional[TranslationCache] = None,
+    cancellation_check=None,
+    throttler: Optional[RateThrottler] = None,
+) -> Tuple[Dict[str, str], int]:
+    """Translate several texts in a single chat completion request
+
+    The texts are sent as a numbered list and the model is asked to return a
+    JSON object mapping each item number to its translation. This cuts the
+    number of API round trips by the batch size compared to one request per
+    paragraph.
+
+    Args:
+        texts: The texts to translate (should not contain duplicates)
+        target_language: The target language
+        client: AsyncOpenAI client instance
+        cache: Optional TranslationCache instance
+        cancellation_check: Optional function to check if translation should be cancelled
+        throttler: Optional RateThrottler to reserve rate limit budget before dispatch
+
+    Returns:
+        Tuple of a dictionary mapping each original text to its translation
+        and the number of API tokens used. The dictionary is empty if the
+        batch failed after all retries; callers may fall back to per-text calls.
+    """
+    if not texts:
+        return {}, 0
+
+    # Prepare the prompt as a numbered list with a JSON-object response
+    numbered_items = "\n".join(f"{i}. {text}" for i, text in enumerate(texts, 1))
+    prompt = (
+        f"Translate each numbered item below into {target_language}. "
+        "Keep formatting such as bold, italic, or links intact. "
+        "Translate only the text itself without adding any explanations. "
+        'Return a JSON object mapping each item number to its translation, e.g. {"1": "...", "2": "..."}.\n\n'
+        f"Items to translate:\n\n{numbered_items}"
+    )
 
     for attempt in range(MAX_RETRIES):
         try:
             # Check for cancellation before making API call
             if cancellation_check and cancellation_check():
-                return "", "cancelled"
+                return {}, 0
 
-            # Streaming response through chat completions API
-            stream = await client.chat.completions.create(
+            # Reserve rate limit budget before dispatching the request
+            if throttler:
+                await throttler.acquire(sum(_estimate_request_tokens(t) for t in texts))
+
+            response = await client.chat.completions.create(
                 model=DEFAULT_MODEL,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=TEMPERATURE,
-                stream=True,
+                response_format={"type": "json_object"},
             )
 
-            translated_text = ""
-            tokens_count = 0
-            async for chunk in stream:
-                # Check for cancellation
-                if cancellation_check and cancellation_check():
-                    # Close the stream if possible
-                    try:
-                        await stream.aclose()
-                    except:
-                        pass
-                    return "", "cancelled"
-
-                # Get the content from the chunk if available
-                content = None
-                if (
-                    chunk.choices
-                    and len(chunk.choices) > 0
-                    and chunk.choices[0].delta.content is not None
-                ):
-                    content = chunk.choices[0].delta.content
-
-                if content:
-                    translated_text += content
-                    tokens_count += 1
-                    if task_id:
-                        translation_progress[task_id]["text"] = translated_text
-                        translation_progress[task_id]["tokens"] = tokens_count
-
-            # Get token usage if available
-            token_usage = None
-            try:
-                # Estimate token usage based on input and output length
-                # Add approximate token counts (rough estimation)
-                input_tokens = len(text.split()) * 1.3  # Approximate tokens in input
-                output_tokens = (
-                    len(translated_text.split()) * 1.3
-                )  # Approximate tokens in output
-                total_tokens = int(input_tokens + output_tokens)
-                token_usage = {"total_tokens": total_tokens}
-                total_tokens_received += total_tokens
-            except Exception as e:
-                logger.warning(f"Could not estimate token usage: {e}")
-
-            # Store in cache
-            if cache:
-                cache.set(text, translated_text, token_usage)
-
-            # Update progress
-            if task_id:
-                translation_progress[task_id] = {
-                    "status": "completed",
-                    "text": translated_text,
-                    "tokens": (
-                        token_usage.get("total_tokens", 0)
-                        if token_usage
-                        else tokens_count
-                    ),
-                    "from_cache": False,
+            content = response.choices[0].message.content or ""
+            parsed = json.loads(content)
+
+            translations: Dict[str, str] = {}
+            for i, text in enumerate(texts, 1):
+                translated = parsed.get(str(i))
+                if translated is None:
+                    raise ValueError(f"Missing item {i} in batch translation response")
+                translations[text] = str(translated)
+
+            # Store each pair in the cache with a locally counted per-text usage
+            estimated_tokens = 0
+            for text, translated in translations.items():
+                token_usage = {
+                    "total_tokens": _count_tokens(text) + _count_tokens(translated)
                 }
+                estimated_tokens += token_usage["total_tokens"]
+                if cache:
+                    cache.set(text, translated, token_usage)
 
-            # Update progress bar if provided
-            if progress_bar:
-                progress_bar.update(1)
+            # Report real token usage when the provider supplies it
+            if response.usage and response.usage.total_tokens:
+                tokens_used = response.usage.total_tokens
+            else:
+                tokens_used = estimated_tokens
 
-            return translated_text, "completed"
+            return translations, tokens_used
 
         except Exception as e:
+            # Drain the shared budget so other tasks back off too
+            if throttler and isinstance(e, RateLimitError):
+                throttler.penalize()
+
             # Exponential backoff with jitter
             retry_delay = INITIAL_RETRY_DELAY * (2**attempt) + INITIAL_RETRY_DELAY * (
                 attempt * 0.1
             )
-            logger.exception(e)
             logger.warning(
-                f"Translation attempt {attempt + 1}/{MAX_RETRIES} failed: {e}, retrying in {retry_delay:.2f}s"
+                f"Batch translation attempt {attempt + 1}/{MAX_RETRIES} failed: {e}, retrying in {retry_delay:.2f}s"
             )
 
             # Check for cancellation before sleeping
             if cancellation_check and cancellation_check():
-                return "", "cancelled"
+                return {}, 0
 
             await asyncio.sleep(retry_delay)
 
-            # Check for cancellation again after sleeping
-            if cancellation_check and cancellation_check():
-                return "", "cancelled"
-
-    # If we're here, all retries failed
-    error_message = f"Failed to translate text after {MAX_RETRIES} attempts"
-    logger.error(error_message)
-
-    # Update progress with error status
-    if task_id:
-        translation_progress[task_id] = {
-            "status": "error",
-            "text": error_message,
-            "tokens": 0,
-        }
-
-    return "", "error"
+    logger.error(f"Failed to translate batch of {len(texts)} texts after {MAX_RETRIES} attempts")
+    return {}, 0
 
 
 def stream_translation(
@@ -392,6 +1036,8 @@ def stream_translation(
     cache: Optional[TranslationCache] = None,
     progress_bar: Optional[tqdm] = None,
     task_id: Optional[str] = None,
+    precomputed: Optional[Dict[str, Any]] = None,
+    cache_checked: bool = False,
 ) -> str:
     """Translate text with streaming using the OpenAI API (synchronous version)
 
@@ -402,25 +1048,32 @@ def stream_translation(
         cache: Optional TranslationCache instance
         progress_bar: Optional tqdm progress bar to update
         task_id: Optional task ID for tracking progress
+        precomputed: Cache entry the caller already looked up for this text,
+            passed in to avoid a second cache query (optional)
+        cache_checked: Whether the caller already looked this text up in the
+            cache and found nothing; precomputed=None alone cannot tell a
+            miss apart from "not checked", so this flag suppresses the
+            redundant second query on misses
 
     Returns:
         The translated text
     """
-    global total_tokens_received, total_cached_tokens, translation_progress
+    global translation_progress
 
     # Initialize task progress if task_id is provided
     if task_id:
         translation_progress[task_id] = {"status": "starting", "text": "", "tokens": 0}
 
-    # Try to get from cache first if cache is provided
-    if cache:
-        cached_translation = cache.get(text)
+    # Use the caller-supplied cache entry, querying the cache only when the
+    # caller has not done so already
+    if precomputed is not None or (cache and not cache_checked):
+        cached_translation = precomputed if precomputed is not None else cache.get(text)
         if cached_translation:
             translated_text = cached_translation["translation"]
             # Update token counts if available
             token_usage = cached_translation.get("token_usage", {})
             if token_usage:
-                total_cached_tokens += token_usage.get("total_tokens", 0)
+                token_counters.cached += token_usage.get("total_tokens", 0)
 
             # Update progress
             if task_id:
@@ -437,60 +1090,79 @@ def stream_translation(
 
             return translated_text
 
-    # Set status to in_progress
+    # Set status to in_progress; bind the per-task dict to a local so the
+    # hot streaming loop below skips the repeated registry lookup
+    task_progress = None
     if task_id:
-        translation_progress[task_id] = {
+        task_progress = {
             "status": "in_progress",
             "text": "",
             "tokens": 0,
         }
+        translation_progress[task_id] = task_progress
 
-    # Prepare the prompt
-    prompt = f"Translate the following text into {target_language}. Keep formatting such as bold, italic, or links intact. Translate only the text itself without adding any explanations.\n\nText to translate:\n\n{text}"
+    # Build the messages with the cached per-language system prompt
+    messages = [_system_message(target_language), {"role": "user", "content": text}]
 
     for attempt in range(MAX_RETRIES):
         try:
             # Streaming response through chat completions API
             stream = client.chat.completions.create(
                 model=DEFAULT_MODEL,
-                messages=[{"role": "user", "content": prompt}],
+                messages=messages,
                 temperature=TEMPERATURE,
                 stream=True,
+                stream_options={"include_usage": True},
             )
 
-            translated_text = ""
+            # Collect deltas in a list and join once at the end; repeated
+            # += on an immutable string degrades to quadratic time. Bind the
+            # append method once rather than paying an attribute lookup per
+            # streamed chunk
+            parts: List[str] = []
+            parts_append = parts.append
             tokens_count = 0
+            stream_usage = None
             for chunk in stream:
-                # Get the content from the chunk if available
-                content = None
-                if (
-                    chunk.choices
-                    and len(chunk.choices) > 0
-                    and chunk.choices[0].delta.content is not None
-                ):
-                    content = chunk.choices[0].delta.content
+                # The chunk schema is fixed: choices[0].delta.content is
+                # either a string or None, so read it directly instead of
+                # probing with hasattr/len on every streamed token
+                delta = chunk.choices[0].delta if chunk.choices else None
+                content = getattr(delta, "content", None)
 
                 if content:
-                    translated_text += content
+                    parts_append(content)
                     tokens_count += 1
-                    if task_id:
-                        translation_progress[task_id]["text"] = translated_text
-                        translation_progress[task_id]["tokens"] = tokens_count
-
-            # Get token usage if available
+                    # Publish the counter at a coarse cadence; a dict write
+                    # per streamed token is pure overhead
+                    if task_progress is not None and tokens_count % 16 == 0:
+                        task_progress["tokens"] = tokens_count
+
+                # The final chunk carries the real usage when requested
+                if chunk.usage:
+                    stream_usage = chunk.usage
+
+            translated_text = "".join(parts)
+            if task_progress is not None:
+                task_progress["text"] = translated_text
+                task_progress["tokens"] = tokens_count
+
+            # Prefer the real token usage from the stream, estimating only for
+            # providers that omit usage chunks
             token_usage = None
-            try:
-                # Estimate token usage based on input and output length
-                # Add approximate token counts (rough estimation)
-                input_tokens = len(text.split()) * 1.3  # Approximate tokens in input
-                output_tokens = (
-                    len(translated_text.split()) * 1.3
-                )  # Approximate tokens in output
-                total_tokens = int(input_tokens + output_tokens)
-                token_usage = {"total_tokens": total_tokens}
-                total_tokens_received += total_tokens
-            except Exception as e:
-                logger.warning(f"Could not estimate token usage: {e}")
+            if stream_usage and stream_usage.total_tokens:
+                token_usage = {"total_tokens": stream_usage.total_tokens}
+                token_counters.api += stream_usage.total_tokens
+            else:
+                try:
+                    # Count tokens locally instead of guessing from word counts
+                    total_tokens = _count_tokens(text) + _count_tokens(
+                        translated_text
+                    )
+                    token_usage = {"total_tokens": total_tokens}
+                    token_counters.api += total_tokens
+                except Exception as e:
+                    logger.warning(f"Could not count token usage: {e}")
 
             # Store in cache
             if cache:
@@ -561,22 +1233,112 @@ def add_translation_to_paragraph(paragraph, translated_text: str) -> None:
     translation_run.font.color.rgb = RGBColor(128, 128, 128)  # Set to gray color
 
 
-def count_translatable_elements(doc: Document, target_styles_set: Set[str]) -> int:
-    """Count the number of paragraphs that will be translated
+def _cancel_pending(tasks: List["asyncio.Task"]) -> None:
+    """Cancel every task in the list that has not finished yet
+
+    Args:
+        tasks: Tasks created with asyncio.create_task
+    """
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+
+
+class _ProgressThrottle:
+    """Rate-limit progress callbacks to avoid per-item update overhead
+
+    Wraps a progress_callback and drops updates that arrive within
+    min_interval of the previous one. The message is supplied as a
+    zero-argument callable so skipped updates never pay for string
+    formatting; milestone updates can be forced through.
+    """
+
+    def __init__(self, callback, min_interval: float = 0.1):
+        """Initialize the throttle
+
+        Args:
+            callback: The progress callback to wrap, or None
+            min_interval: Minimum seconds between emitted updates
+        """
+        self._callback = callback
+        self._min_interval = min_interval
+        self._last_emit = 0.0
+
+    def update(self, current: int, total: int, msg_fn, force: bool = False) -> None:
+        """Invoke the wrapped callback if enough time has passed
+
+        Args:
+            current: Number of items processed so far
+            total: Total number of items
+            msg_fn: Zero-argument callable returning the progress message
+            force: Emit even if the interval has not elapsed
+        """
+        if not self._callback:
+            return
+        now = time.monotonic()
+        if force or now - self._last_emit >= self._min_interval:
+            self._last_emit = now
+            self._callback(current, total, msg_fn())
+
+
+def _iter_document_paragraphs(doc: Document):
+    """Yield every paragraph in the document body and its tables
+
+    Flattens the body paragraphs and the nested tables/rows/cells walk into
+    one iterator so callers filter paragraphs in a single loop instead of
+    duplicating the traversal logic per container type.
+
+    Args:
+        doc: The Document object
+
+    Yields:
+        Paragraph objects in document order, body first, then table cells
+    """
+    for paragraph in doc.paragraphs:
+        yield paragraph
+    for table in doc.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                for paragraph in cell.paragraphs:
+                    yield paragraph
+
+
+def collect_translatable_paragraphs(
+    doc: Document, target_styles_set: FrozenSet[str]
+) -> Tuple[List[Any], List[str]]:
+    """Collect the paragraphs to translate in a single pass over the document
+
+    Each paragraph's text is read exactly once; Paragraph.text walks every
+    run element and concatenates their text on each access, so repeated reads
+    across separate counting and collection passes add up on large documents.
+
+    The paragraphs and their texts are returned as two parallel lists rather
+    than one list of tuples, halving the per-paragraph object count. Table
+    cell paragraphs are included through the shared document iterator.
 
     Args:
         doc: The Document object
         target_styles_set: Set of style names to translate
 
     Returns:
-        Count of paragraphs to translate
+        Tuple of (paragraphs, stripped texts) lists in document order
     """
-    count = 0
-    for paragraph in doc.paragraphs:
-        style_name = paragraph.style.name
-        if style_name in target_styles_set and paragraph.text.strip():
-            count += 1
-    return count
+    paras: List[Any] = []
+    texts: List[str] = []
+    for paragraph in _iter_document_paragraphs(doc):
+        if paragraph.style.name not in target_styles_set:
+            continue
+
+        text = paragraph.text
+        # Skip if already contains translation (for safety)
+        if "\n" in text:
+            continue
+
+        text = text.strip()
+        if text:
+            paras.append(paragraph)
+            texts.append(text)
+    return paras, texts
 
 
 async def process_document_parallel(
@@ -590,9 +1352,15 @@ async def process_document_parallel(
     max_concurrent: int = DEFAULT_MAX_CONCURRENT,
     progress_callback=None,
     cancellation_check=None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_per_second: Optional[float] = None,
 ) -> None:
     """Process a document in parallel, translating paragraphs concurrently
 
+    Results are streamed back with asyncio.as_completed and written into the
+    document as each task finishes, so docx edits overlap in-flight network
+    requests and no barrier gather holds the full result set in memory.
+
     Args:
         input_file: Path to the input DOCX file
         output_file: Path to save the translated DOCX file
@@ -604,20 +1372,26 @@ async def process_document_parallel(
         max_concurrent: Maximum number of concurrent translation requests
         progress_callback: Optional callback function for progress updates
         cancellation_check: Optional function to check if process should be cancelled
+        batch_size: Number of texts grouped into one API request
+        max_per_second: Optional cap on request dispatch rate, enforced
+            through the rate throttler
     """
-    global translation_progress, total_tokens_received, total_cached_tokens
+    global translation_progress
 
     # Reset token counters
-    total_tokens_received = 0
-    total_cached_tokens = 0
+    token_counters.reset()
     translation_progress = {}
 
     logger.info(f"Processing document {input_file} in parallel mode")
     start_time = time.time()
 
-    # Create async OpenAI client
+    # Reuse the pooled async client for this key/endpoint; repeated runs in
+    # the same process (e.g. the web UI) then skip DNS, TLS handshakes, and
+    # client construction entirely
     async_client = setup_async_openai_client(
-        api_key=openai_client.api_key, base_url=openai_client.base_url
+        api_key=openai_client.api_key,
+        base_url=openai_client.base_url,
+        pool_size=max_concurrent * 2,
     )
 
     # Set up translation cache if enabled
@@ -630,146 +1404,297 @@ async def process_document_parallel(
     # Load the document
     doc = Document(input_file)
 
-    # Convert target_styles to a set for faster lookups
-    target_styles_set = set(target_styles)
+    # Freeze target_styles for O(1) per-paragraph membership tests
+    target_styles_set = frozenset(target_styles)
 
-    # Count total paragraphs to translate for progress tracking
-    total_paragraphs = count_translatable_elements(doc, target_styles_set)
+    # Collect the paragraphs to translate in a single pass
+    paras, texts = collect_translatable_paragraphs(doc, target_styles_set)
+    total_paragraphs = len(texts)
     logger.info(f"Found {total_paragraphs} paragraphs to translate")
 
+    # Coalesce progress updates so fast cache hits don't spend their time
+    # formatting and emitting per-paragraph messages
+    progress = _ProgressThrottle(progress_callback)
+
     # Initial progress update
-    if progress_callback:
-        progress_callback(0, total_paragraphs, "Starting translation...")
+    progress.update(0, total_paragraphs, lambda: "Starting translation...", force=True)
 
     # Check if we should cancel before starting
     if cancellation_check and cancellation_check():
         logger.info("Translation cancelled before starting")
         return
 
-    # Process paragraphs in parallel
-    semaphore = asyncio.Semaphore(max_concurrent)
-    tasks = []
-
-    async def translate_with_semaphore(text, task_num, task_idx):
-        """Helper function to translate text with semaphore for concurrency control"""
-        task_id = f"task_{task_idx}"
+    # Map each unique text to the indices of the paragraphs that contain it
+    text_to_indices: Dict[str, List[int]] = {}
+    for i, text in enumerate(texts):
+        text_to_indices.setdefault(text, []).append(i)
 
-        # Check if we should cancel
-        if cancellation_check and cancellation_check():
-            return None, task_num, task_idx
+    # Resolve cache hits up front with one bulk lookup so only uncached
+    # texts are dispatched. Results are written into the document as they
+    # resolve, so no dict of finished translations needs to be kept; progress
+    # is tracked in units of paragraphs (duplicates count once per occurrence)
+    pending_texts: List[str] = []
+    processed_paragraphs = 0
+    cached_entries = cache.get_many(list(text_to_indices)) if cache else {}
+    for text, indices in text_to_indices.items():
+        cached_translation = cached_entries.get(text)
+        if cached_translation:
+            # Cache hits can be written into the document straight away
+            for i in indices:
+                add_translation_to_paragraph(paras[i], cached_translation["translation"])
+            processed_paragraphs += len(indices)
+            token_usage = cached_translation.get("token_usage", {})
+            if token_usage:
+                token_counters.cached += token_usage.get("total_tokens", 0)
+        else:
+            pending_texts.append(text)
 
-        async with semaphore:
-            # Check again after acquiring semaphore
-            if cancellation_check and cancellation_check():
-                return None, task_num, task_idx
+    if processed_paragraphs:
+        progress.update(
+            processed_paragraphs,
+            total_paragraphs,
+            lambda: f"Translating paragraph {processed_paragraphs}/{total_paragraphs}",
+        )
 
-            translation, status = await stream_async_translation(
-                text,
-                target_language,
-                async_client,
-                cache,
-                None,  # No progress bar in parallel mode
-                task_id,
-                cancellation_check,
+    # Pack the remaining texts greedily into batches so several paragraphs
+    # share one API request, bounded by a character budget as well as the
+    # count: fixed-size batches would let a few long paragraphs blow past a
+    # comfortable request size while packing short list items inefficiently.
+    # An oversized text gets a batch of its own, which the single-text path
+    # handles; so does a trailing batch of one.
+    batches: List[List[str]] = []
+    current_batch: List[str] = []
+    current_chars = 0
+    for text in pending_texts:
+        if current_batch and (
+            current_chars + len(text) > DEFAULT_MAX_BATCH_CHARS
+            or len(current_batch) >= batch_size
+        ):
+            batches.append(current_batch)
+            current_batch = []
+            current_chars = 0
+        current_batch.append(text)
+        current_chars += len(text)
+    if current_batch:
+        batches.append(current_batch)
+
+    # Right-size concurrency from the document's token footprint: with short
+    # paragraphs the full admission limit stays well inside the TPM budget; a
+    # document of long paragraphs would trip rate limits before the throttler
+    # can pace it. Assume a request stays in flight for roughly five seconds,
+    # so the sustainable in-flight count is five seconds' worth of token
+    # budget divided by the average cost of one batched request.
+    effective_concurrency = max_concurrent
+    if batches:
+        avg_request_tokens = sum(
+            _estimate_request_tokens(text) for text in pending_texts
+        ) / len(batches)
+        sustainable = int(DEFAULT_TPM / 60 * 5 / max(avg_request_tokens, 1))
+        effective_concurrency = max(1, min(max_concurrent, sustainable))
+        if effective_concurrency < max_concurrent:
+            logger.info(
+                f"Reducing concurrency from {max_concurrent} to {effective_concurrency} "
+                f"to stay within the {DEFAULT_TPM} tokens-per-minute budget"
             )
 
-            # Update progress
-            if progress_callback:
-                processed = len(
-                    [
-                        t
-                        for t in translation_progress.values()
-                        if t.get("status") in ("completed", "error", "cached")
-                    ]
+    admission = AdmissionController(effective_concurrency)
+    cancel_event = asyncio.Event()
+
+    # A per-second dispatch cap folds into the throttler's requests-per-minute
+    # bucket, which already paces request starts
+    if max_per_second:
+        throttler = RateThrottler(rpm=min(DEFAULT_RPM, max(1, int(max_per_second * 60))))
+    else:
+        throttler = RateThrottler()
+
+    async def translate_batch_admitted(batch, batch_idx):
+        """Helper function to translate a batch of texts under the admission limit
+
+        Returns a tuple of (translations, api_tokens, cached_tokens); token
+        totals are accumulated by the caller rather than through globals.
+        """
+        # Check if we should cancel
+        if cancel_event.is_set():
+            return {}, 0, 0
+
+        await admission.acquire()
+        try:
+            # Check again after being admitted
+            if cancel_event.is_set():
+                return {}, 0, 0
+
+            if len(batch) == 1:
+                # Single-text path for the final tail chunk
+                translation, status, tokens_used = await stream_async_translation(
+                    batch[0],
+                    target_language,
+                    async_client,
+                    cache,
+                    None,  # No progress bar in parallel mode
+                    f"batch_{batch_idx}_0",
+                    throttler,
+                    cache_checked=True,
                 )
-                progress_callback(
-                    processed,
-                    total_paragraphs,
-                    f"Translating paragraph {processed}/{total_paragraphs}",
+                if not translation:
+                    return {}, 0, 0
+                if status == "cached":
+                    return {batch[0]: translation}, 0, tokens_used
+                return {batch[0]: translation}, tokens_used, 0
+
+            result, tokens_used = await batch_translate(
+                batch, target_language, async_client, cache, cancel_event.is_set, throttler
+            )
+            if result:
+                return result, tokens_used, 0
+
+            # Batch failed after retries; fall back to per-text requests
+            result = {}
+            api_tokens = 0
+            cached_tokens = 0
+            for j, text in enumerate(batch):
+                if cancel_event.is_set():
+                    break
+                translation, status, tokens_used = await stream_async_translation(
+                    text,
+                    target_language,
+                    async_client,
+                    cache,
+                    None,
+                    f"batch_{batch_idx}_{j}",
+                    throttler,
+                    cache_checked=True,
                 )
-
-            return translation, task_num, task_idx
-
-    # Prepare tasks for all paragraphs that need translation
-    paragraph_tasks = []
-    task_idx = 0
-    for i, paragraph in enumerate(doc.paragraphs):
-        style_name = paragraph.style.name
-        if style_name in target_styles_set and paragraph.text.strip():
-            # Skip if already contains translation (for safety)
-            if "\n" in paragraph.text:
-                continue
-
-            text = paragraph.text.strip()
-            if text:
-                # Create a task to translate this paragraph
-                task = translate_with_semaphore(text, i, task_idx)
-                paragraph_tasks.append((i, task_idx, task))
-                task_idx += 1
-
-    # Check if we should cancel before starting tasks
+                if translation:
+                    result[text] = translation
+                    if status == "cached":
+                        cached_tokens += tokens_used
+                    else:
+                        api_tokens += tokens_used
+            return result, api_tokens, cached_tokens
+        finally:
+            await admission.release()
+
+    # Check if we should cancel before starting tasks, then hand the
+    # (potentially costly) callback to a timer task that publishes through an
+    # asyncio.Event: the hot paths above do a C-level is_set() check instead
+    # of a Python call per task
     if cancellation_check and cancellation_check():
         logger.info("Translation cancelled before tasks started")
         return
 
-    # Start all translation tasks
-    for _, task_idx, task in paragraph_tasks:
-        tasks.append(asyncio.create_task(task))
+    # The wave loop below swaps the live task list into this container so the
+    # poller can abort work already in flight, not just block new dispatch
+    active_tasks: List["asyncio.Task"] = []
+
+    poller = None
+    if cancellation_check:
+
+        async def _poll_cancellation():
+            while True:
+                await asyncio.sleep(0.25)
+                if cancellation_check():
+                    cancel_event.set()
+                    # Cancel the current wave directly: without this a cancel
+                    # request would wait for the in-flight requests (and their
+                    # full retry schedules) to finish on their own
+                    _cancel_pending(active_tasks)
+                    return
+
+        poller = asyncio.create_task(_poll_cancellation())
+
+    try:
+        # Schedule the batch tasks in waves instead of all at once: the admission
+        # limit caps concurrency but not how many tasks pile up behind it, and on
+        # a document with thousands of paragraphs that backlog wastes memory and
+        # amplifies retries once rate limits bite. A wave of a few times the
+        # concurrency keeps the pipeline full without the pile-up.
+        wave_size = max(1, max_concurrent * 4)
+        for wave_start in range(0, len(batches), wave_size):
+            tasks = [
+                asyncio.create_task(translate_batch_admitted(batch, wave_start + offset))
+                for offset, batch in enumerate(
+                    batches[wave_start : wave_start + wave_size]
+                )
+            ]
+            active_tasks[:] = tasks
 
-    # Wait for all tasks to complete or cancellation
-    translations = []
-    for task in asyncio.as_completed(tasks):
-        # Check for cancellation
-        if cancellation_check and cancellation_check():
-            # Cancel all remaining tasks
-            for t in tasks:
-                if not t.done():
-                    t.cancel()
-            logger.info("Translation cancelled during processing")
-            return
+            # Wait for the wave to complete or cancellation
+            for task in asyncio.as_completed(tasks):
+                # Check for cancellation
+                if cancel_event.is_set():
+                    _cancel_pending(tasks)
+                    logger.info("Translation cancelled during processing")
+                    return
+
+                try:
+                    result, api_tokens, cached_tokens = await task
+                    if result:
+                        # Write finished translations into the document as they
+                        # arrive so docx edits overlap the remaining network waits
+                        for text, translation in result.items():
+                            indices = text_to_indices[text]
+                            for i in indices:
+                                add_translation_to_paragraph(paras[i], translation)
+                            processed_paragraphs += len(indices)
+
+                        # Reduce token totals here, in a single writer, instead of
+                        # having every worker mutate the module-level counters
+                        token_counters.api += api_tokens
+                        token_counters.cached += cached_tokens
+
+                        # Update progress
+                        progress.update(
+                            processed_paragraphs,
+                            total_paragraphs,
+                            lambda n=processed_paragraphs: f"Translating paragraph {n}/{total_paragraphs}",
+                        )
+                except asyncio.CancelledError:
+                    # Task was cancelled
+                    continue
+                except Exception:
+                    # Cancel the rest of the wave before propagating, the way
+                    # asyncio.TaskGroup does on 3.11+: letting siblings run to
+                    # completion after an unexpected failure only burns API
+                    # quota on work that will never be saved
+                    _cancel_pending(tasks)
+                    logger.exception(
+                        "Translation task failed; cancelling remaining tasks"
+                    )
+                    raise
+    finally:
+        # Stop the poller once no more tasks can be dispatched; the cold
+        # path below checks the callback directly
+        if poller:
+            poller.cancel()
 
-        try:
-            result = await task
-            if result:
-                translation, para_idx, task_idx = result
-                translations.append((para_idx, translation))
-        except asyncio.CancelledError:
-            # Task was cancelled
-            continue
-        except Exception as e:
-            logger.error(f"Error in translation task: {e}")
 
-    # Check if we should cancel before applying translations
+    # Check if we should cancel before saving
     if cancellation_check and cancellation_check():
-        logger.info("Translation cancelled before applying translations")
+        logger.info("Translation cancelled before saving the document")
         return
 
-    # Sort translations by paragraph index
-    translations.sort(key=lambda x: x[0])
-
-    # Apply translations to paragraphs
-    para_lookup = {i: para for i, para in enumerate(doc.paragraphs)}
-    for para_idx, translation in translations:
-        if translation:  # Skip if translation is empty (due to error or cancellation)
-            add_translation_to_paragraph(para_lookup[para_idx], translation)
-
-    # Save the document
+    # Save the document off the event loop: XML serialization of a large
+    # document blocks for seconds and would freeze progress updates
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    doc.save(output_file)
+    await asyncio.to_thread(doc.save, output_file)
+
+    # Commit any pending cache writes, likewise off the loop
+    if cache:
+        await asyncio.to_thread(cache.save)
 
     # Final progress update
     elapsed_time = time.time() - start_time
     logger.info(f"Document processed in {elapsed_time:.2f} seconds")
     logger.info(
-        f"Used {total_tokens_received} API tokens and {total_cached_tokens} cached tokens"
+        f"Used {token_counters.api} API tokens and {token_counters.cached} cached tokens"
     )
 
-    if progress_callback:
-        progress_callback(
-            total_paragraphs,
-            total_paragraphs,
-            f"Translation completed in {elapsed_time:.2f} seconds",
-        )
+    progress.update(
+        total_paragraphs,
+        total_paragraphs,
+        lambda: f"Translation completed in {elapsed_time:.2f} seconds",
+        force=True,
+    )
 
 
 def process_document(
@@ -784,6 +1709,8 @@ def process_document(
     max_concurrent: int = DEFAULT_MAX_CONCURRENT,
     progress_callback=None,
     cancellation_check=None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_per_second: Optional[float] = None,
 ) -> None:
     """Process a document, translating specified paragraph styles
 
@@ -801,12 +1728,13 @@ def process_document(
         max_concurrent: Maximum number of concurrent translation requests
         progress_callback: Optional callback function for progress updates
         cancellation_check: Optional function to check if process should be cancelled
+        batch_size: Number of texts grouped into one API request (parallel mode)
+        max_per_second: Optional cap on request dispatch rate (parallel mode)
     """
-    global translation_progress, total_tokens_received, total_cached_tokens
+    global translation_progress
 
     # Reset token counters
-    total_tokens_received = 0
-    total_cached_tokens = 0
+    token_counters.reset()
     translation_progress = {}
 
     if parallel:
@@ -823,6 +1751,8 @@ def process_document(
                 max_concurrent,
                 progress_callback,
                 cancellation_check,
+                batch_size,
+                max_per_second,
             )
         )
     else:
@@ -864,7 +1794,7 @@ def process_document_sequential(
         progress_callback: Optional callback function for progress updates
         cancellation_check: Optional function to check if process should be cancelled
     """
-    global translation_progress, total_tokens_received, total_cached_tokens
+    global translation_progress
 
     logger.info(f"Processing document {input_file} in sequential mode")
     start_time = time.time()
@@ -879,58 +1809,82 @@ def process_document_sequential(
     # Load the document
     doc = Document(input_file)
 
-    # Convert target_styles to a set for faster lookups
-    target_styles_set = set(target_styles)
+    # Freeze target_styles for O(1) per-paragraph membership tests
+    target_styles_set = frozenset(target_styles)
 
-    # Count total paragraphs to translate for progress tracking
-    total_paragraphs = count_translatable_elements(doc, target_styles_set)
+    # Collect the paragraphs to translate in a single pass
+    paras, texts = collect_translatable_paragraphs(doc, target_styles_set)
+    total_paragraphs = len(texts)
     logger.info(f"Found {total_paragraphs} paragraphs to translate")
 
-    # Use tqdm for progress tracking in CLI mode
-    progress_bar = tqdm(total=total_paragraphs, desc="Translating paragraphs")
+    # Use tqdm for progress tracking in CLI mode; let it render on its own
+    # timer rather than on every update so fast cache hits don't spend their
+    # time re-drawing the bar
+    progress_bar = tqdm(
+        total=total_paragraphs, desc="Translating paragraphs", mininterval=0.5
+    )
 
-    # Track current progress
+    # Track current progress; coalesce callback updates the same way the
+    # parallel path does
+    progress = _ProgressThrottle(progress_callback)
     processed_paragraphs = 0
 
+    # Collapse duplicate texts within the run: with caching disabled (or a
+    # cold cache) repeated strings would otherwise each pay an API call
+    seen_translations: Dict[str, str] = {}
+
     # Process each paragraph
-    for paragraph in doc.paragraphs:
+    for paragraph, text in zip(paras, texts):
         # Check if we should cancel
         if cancellation_check and cancellation_check():
             logger.info("Translation cancelled")
             progress_bar.close()
             return
 
-        style_name = paragraph.style.name
-        if style_name in target_styles_set and paragraph.text.strip():
-            # Skip if already contains translation (for safety)
-            if "\n" in paragraph.text:
-                continue
-
-            text = paragraph.text.strip()
-            if text:
-                # Translate the paragraph
-                task_id = f"para_{processed_paragraphs}"
-                translated_text = stream_translation(
-                    text, target_language, openai_client, cache, progress_bar, task_id
-                )
+        if text in seen_translations:
+            # Duplicate of a paragraph translated earlier in this run
+            translated_text = seen_translations[text]
+            progress_bar.update(1)
+        else:
+            # Look the text up in the cache exactly once and hand the result
+            # to stream_translation so it does not repeat the query
+            cached = cache.get(text) if cache else None
+
+            # Translate the paragraph
+            task_id = f"para_{processed_paragraphs}"
+            translated_text = stream_translation(
+                text,
+                target_language,
+                openai_client,
+                cache,
+                progress_bar,
+                task_id,
+                precomputed=cached,
+                cache_checked=True,
+            )
+            if translated_text:
+                seen_translations[text] = translated_text
 
-                # Add translation to the paragraph
-                if translated_text:
-                    add_translation_to_paragraph(paragraph, translated_text)
+        # Add translation to the paragraph
+        if translated_text:
+            add_translation_to_paragraph(paragraph, translated_text)
 
-                # Update progress
-                processed_paragraphs += 1
-                if progress_callback:
-                    progress_callback(
-                        processed_paragraphs,
-                        total_paragraphs,
-                        f"Translating paragraph {processed_paragraphs}/{total_paragraphs}",
-                    )
+        # Update progress
+        processed_paragraphs += 1
+        progress.update(
+            processed_paragraphs,
+            total_paragraphs,
+            lambda n=processed_paragraphs: f"Translating paragraph {n}/{total_paragraphs}",
+        )
 
     # Save the document
     output_file.parent.mkdir(parents=True, exist_ok=True)
     doc.save(output_file)
 
+    # Commit any pending cache writes
+    if cache:
+        cache.save()
+
     # Close progress bar
     progress_bar.close()
 
@@ -938,15 +1892,15 @@ def process_document_sequential(
     elapsed_time = time.time() - start_time
     logger.info(f"Document processed in {elapsed_time:.2f} seconds")
     logger.info(
-        f"Used {total_tokens_received} API tokens and {total_cached_tokens} cached tokens"
+        f"Used {token_counters.api} API tokens and {token_counters.cached} cached tokens"
     )
 
-    if progress_callback:
-        progress_callback(
-            total_paragraphs,
-            total_paragraphs,
-            f"Translation completed in {elapsed_time:.2f} seconds",
-        )
+    progress.update(
+        total_paragraphs,
+        total_paragraphs,
+        lambda: f"Translation completed in {elapsed_time:.2f} seconds",
+        force=True,
+    )
 
 
 def clear_translation_caches(cache_dir: Path = DEFAULT_CACHE_DIR) -> None:
@@ -961,8 +1915,12 @@ def clear_translation_caches(cache_dir: Path = DEFAULT_CACHE_DIR) -> None:
         logger.info(f"Cache directory {cache_dir} does not exist. Nothing to clear.")
         return
 
-    # Find and remove all cache files
-    for cache_file in cache_dir.glob("cache_*.json"):
+    # Find and remove all cache files (SQLite databases with their WAL/SHM
+    # sidecars, plus any legacy JSON caches)
+    cache_files = list(cache_dir.glob("cache_*.db*")) + list(
+        cache_dir.glob("cache_*.json*")
+    )
+    for cache_file in cache_files:
         try:
             cache_file.unlink()
             logger.info(f"Removed cache file: {cache_file.name}")